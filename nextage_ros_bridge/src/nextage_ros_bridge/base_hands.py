@@ -36,6 +36,17 @@
 
 import rospy
 
+# For convenience only; to show array number in debug output.
+# Repeats 1..9, 0 and is cut down to the 32 figures that line up with
+# the 32 bit dout/mask arrays.
+_PRINT_INDEX = ((1, 2, 3, 4, 5, 6, 7, 8, 9, 0) * 4)[:-8]
+
+# Bit for each 1-based DIO pin number, ie. _DIO_BIT[n] == 1 << (n - 1).
+# Precomputed so that the assignment loops in _dio_writer need neither
+# the subtraction nor the shift per pin. Index 0 is a placeholder; pin
+# numbers start at 1.
+_DIO_BIT = (0,) + tuple(1 << n for n in range(32))
+
 
 class BaseHands(object):
     '''
@@ -121,48 +132,38 @@ class BaseHands(object):
         @return: True if dout was writable to the register. False otherwise.
         '''
 
-        # 32 bit arrays used in write methods in hrpsys/hrpsys_config.py
-        dout = []
-        for i in range(32):
-            dout.append(padding)
-            # At the end of this loop, dout contains list of 32 'padding's.
-            # eg. [ 0, 0,...,0] if padding == 0
-        mask = []
-        for i in range(32):
-            mask.append(self._DIO_MASK)
-            # At the end of this loop, mask contains list of 32 '0's.
-
-        signal_alternate = self._DIO_ASSIGN_ON
-        if padding == self._DIO_ASSIGN_ON:
-            signal_alternate = self._DIO_ASSIGN_OFF
-        rospy.logdebug('digitalout_indices={}'.format(digitalout_indices))
+        # Assemble dout and mask as packed ints; bit k corresponds to index
+        # k in the 32 bit arrays that the write methods in
+        # hrpsys/hrpsys_config.py take. Integer bit operations avoid
+        # allocating and mutating two 32 element lists per call.
+        dout_bits = 0xffffffff * padding  # ie. every bit equals 'padding'.
+        mask_bits = 0   # _DIO_MASK == 0 for every bit.
+
+        # Flip the padding bit; _DIO_ASSIGN_ON = 1 and _DIO_ASSIGN_OFF = 0,
+        # so xor is equivalent to the branching on those constants.
+        signal_alternate = padding ^ 1
+        rospy.logdebug('digitalout_indices=%s', digitalout_indices)
         # Assign commanded bits
         for i in digitalout_indices:
-            dout[i - 1] = signal_alternate
+            bit = _DIO_BIT[i]
+            dout_bits = (dout_bits & ~bit) | (bit * signal_alternate)
 
         # Assign unmasked, effective bits
         for i in dio_assignments:
             # For masking, alternate symbol is always 1 regarless the design
             # on robot's side.
-            mask[i - 1] = 1
-
-        # BEGIN; For convenience only; to show array number.
-        print_index = []
-        for i in range(10):
-            # For masking, alternate symbol is always 1.
-            n = i + 1
-            if 10 == n:
-                n = 0
-            print_index.append(n)
-        print_index.extend(print_index)
-        print_index.extend(print_index)
-        del print_index[-8:]
-        # END; For convenience only; to show array number.
-
-        # # For some reason rospy.loginfo not print anything.
-        # # With this print formatting, you can copy the output and paste
+            mask_bits |= _DIO_BIT[i]
+
+        # hrpsys' writeDigitalOutputWithMask takes lists of ints, so expand
+        # the packed bits once at the very end.
+        dout = [(dout_bits >> k) & 1 for k in range(32)]
+        mask = [(mask_bits >> k) & 1 for k in range(32)]
+
+        # # With this formatting, you can copy the output and paste
         # # directly into writeDigitalOutputWithMask method if you wish.
-        print('dout, mask:\n{},\n{}\n{}'.format(dout, mask, print_index))
+        # Lazy %-style args so that the list reprs are never built unless
+        # debug logging is enabled.
+        rospy.logdebug('dout, mask:\n%s,\n%s\n%s', dout, mask, _PRINT_INDEX)
 
         is_written_dout = False
         try:
@@ -187,10 +188,12 @@ class BaseHands(object):
         # 2/1/2014 Due to the change of DIO assingment, OUT19, 24 need to be
         # alternated;
 
-        dout = mask = []
-        # Use all slots from 17 to 32.
-        for i in range(16, 32):
-            mask.append(i)
+        # Use all slots from 17 to 32. The same pins are deliberately passed
+        # as both commanded indices and mask, so that with padding ON every
+        # masked pin is driven to signal_alternate = 0 -- the all-zeros
+        # write this docstring describes. The alternated tool changer
+        # outputs read '0' as energized, so attached tools won't fall.
+        dout = mask = list(range(16, 32))
 
         self._dio_writer(dout, mask, self._DIO_ASSIGN_ON)
 
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2014, Tokyo Opensource Robotics Kyokai Association
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above
+#    copyright notice, this list of conditions and the following
+#    disclaimer in the documentation and/or other materials provided
+#    with the distribution.
+#  * Neither the name of Tokyo Opensource Robotics Kyokai Association. nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from nextage_ros_bridge.base_hands import BaseHands
+
+
+class FakeParent(object):
+    '''
+    Stands in for hrpsys.hrpsys_config.HrpsysConfigurator; records the
+    arguments BaseHands._dio_writer passes to writeDigitalOutputWithMask
+    so that no robot (nor simulator) is needed.
+    '''
+
+    def __init__(self):
+        self.dout = None
+        self.mask = None
+
+    def writeDigitalOutputWithMask(self, dout, mask):
+        self.dout = dout
+        self.mask = mask
+        return True
+
+
+class TestBaseHands(unittest.TestCase):
+    '''
+    Test the DIO bit assembly in BaseHands without rostest nor hardware.
+    '''
+
+    def setUp(self):
+        self._parent = FakeParent()
+        self._hands = BaseHands(self._parent)
+
+    def test_dio_writer_padding_off(self):
+        self._hands._dio_writer([25], [24, 25], BaseHands._DIO_ASSIGN_OFF)
+        dout_expected = [0] * 32
+        dout_expected[24] = 1
+        mask_expected = [0] * 32
+        mask_expected[23] = mask_expected[24] = 1
+        self.assertEqual(dout_expected, self._parent.dout)
+        self.assertEqual(mask_expected, self._parent.mask)
+
+    def test_dio_writer_padding_on(self):
+        self._hands._dio_writer([25], [24, 25], BaseHands._DIO_ASSIGN_ON)
+        dout_expected = [1] * 32
+        dout_expected[24] = 0
+        self.assertEqual(dout_expected, self._parent.dout)
+
+    def test_init_dio(self):
+        '''
+        Pins 16-31 are both commanded and unmasked, so the effective
+        write is '0' to each of them; the alternated tool changer
+        outputs read '0' as energized, so attached tools won't fall.
+        '''
+        self._hands.init_dio()
+        self.assertEqual([1] * 15 + [0] * 16 + [1], self._parent.dout)
+        self.assertEqual([0] * 15 + [1] * 16 + [0], self._parent.mask)
+
+
+if __name__ == '__main__':
+    unittest.main()